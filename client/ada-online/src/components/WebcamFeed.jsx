@@ -37,17 +37,27 @@ function WebcamFeed({ isVisible, onClose, socket }) {
     context.drawImage(video, 0, 0, canvas.width, canvas.height);
 
     try {
-      // Get frame as base64 encoded JPEG
+      // Get frame as binary JPEG (sent as a binary WebSocket frame, no base64)
       // Use a lower quality (e.g., 0.7) to reduce data size
-      const frameDataUrl = canvas.toDataURL("image/jpeg", 0.7);
-
-      // Send frame data via socket
-      if (socket.current.connected) {
-        // console.log("Sending video frame..."); // Optional: for debugging
-        socket.current.emit("send_video_frame", { frame: frameDataUrl });
-      }
+      canvas.toBlob(
+        (blob) => {
+          if (!blob) return;
+          blob
+            .arrayBuffer()
+            .then((frameBuffer) => {
+              // Send frame data via socket
+              if (socket.current?.connected) {
+                // console.log("Sending video frame..."); // Optional: for debugging
+                socket.current.emit("send_video_frame", frameBuffer);
+              }
+            })
+            .catch((e) => console.error("Error reading frame blob:", e));
+        },
+        "image/jpeg",
+        0.7
+      );
     } catch (e) {
-      console.error("Error converting canvas to data URL:", e);
+      console.error("Error converting canvas to JPEG blob:", e);
       // Handle cases where canvas might be tainted (though unlikely with webcam)
     }
   }, [socket]); // Dependency: socket
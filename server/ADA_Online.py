@@ -10,6 +10,7 @@ from google import genai
 import googlemaps
 from datetime import datetime 
 import os
+import logging
 from dotenv import load_dotenv
 import websockets
 import json
@@ -19,13 +20,15 @@ from bs4 import BeautifulSoup # For HTML parsing
 
 load_dotenv()
 
+log = logging.getLogger('ada.assistant')
+
 ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 MAPS_API_KEY = os.getenv("MAPS_API_KEY") 
 
-if not ELEVENLABS_API_KEY: print("Error: ELEVENLABS_API_KEY not found.")
-if not GOOGLE_API_KEY: print("Error: GOOGLE_API_KEY not found.")
-if not MAPS_API_KEY: print("Error: MAPS_API_KEY not found.")
+if not ELEVENLABS_API_KEY: log.error("ELEVENLABS_API_KEY not found.")
+if not GOOGLE_API_KEY: log.error("GOOGLE_API_KEY not found.")
+if not MAPS_API_KEY: log.error("MAPS_API_KEY not found.")
 
 
 VOICE_ID = 'pFZP5JQG7iQjIQuC4Bku'
@@ -35,21 +38,28 @@ CHUNK_SIZE = 1024
 MAX_QUEUE_SIZE = 1
 
 MODEL_ID = "eleven_flash_v2_5" # Example model - check latest recommended models
+GEMINI_MODEL = "gemini-2.0-flash" # Or your chosen model
+GEMINI_WARMUP_TIMEOUT = 5 # Seconds; a stalled endpoint must not hold up server startup
+
+COALESCE_WINDOW = 0.01 # Seconds to gather streamed chunks into one SocketIO message
+COALESCED_EVENTS = {'receive_text_chunk': 'text', 'receive_audio_chunk': 'audio'} # event -> payload field
 
 class ADA:
-    def __init__(self, socketio_instance=None, client_sid=None):
+    def __init__(self, socketio_instance=None, client_sid=None, prewarmed_resources=None):
         # --- Initialization ---
-        print("initializing ADA for web...")
+        log.info("initializing ADA for web...")
         self.socketio = socketio_instance
         self.client_sid = client_sid
         self.Maps_api_key = MAPS_API_KEY
 
-        if torch.cuda.is_available():
+        if prewarmed_resources:
+            self.device = prewarmed_resources['device']
+        elif torch.cuda.is_available():
             self.device = "cuda"
-            print("CUDA is available. Using GPU.")
+            log.info("CUDA is available. Using GPU.")
         else:
             self.device = "cpu"
-            print("CUDA is not available. Using CPU.")
+            log.info("CUDA is not available. Using CPU.")
 
         # --- Function Declarations (Keep as before) ---
         self.get_weather_func = types.FunctionDeclaration(
@@ -112,21 +122,55 @@ class ADA:
             ]  # <--- End the list here
         )
 
-        self.client = genai.Client(api_key=GOOGLE_API_KEY)
-        self.model = "gemini-2.0-flash" # Or your chosen model
+        self.client = prewarmed_resources['client'] if prewarmed_resources else genai.Client(api_key=GOOGLE_API_KEY)
+        self.model = GEMINI_MODEL
         self.chat = self.client.aio.chats.create(model=self.model, config=self.config)
 
         # Queues and tasks
-        self.latest_video_frame_data_url = None # If using single-frame logic
+        self.latest_video_frame = None # (frame_bytes, mime_type) if using single-frame logic
         self.input_queue = asyncio.Queue()
         self.response_queue = asyncio.Queue()
         self.audio_output_queue = asyncio.Queue()
 
+        self.coalesced_chunks = {} # event -> chunks waiting for the next coalesced emit
+
         self.gemini_session = None
         self.tts_websocket = None
         self.tasks = []
         # --- End of __init__ ---
 
+    @classmethod
+    async def preload_models(cls):
+        """ Builds the resources all ADA instances share (device, Gemini client) once, before clients connect. """
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        log.info("Preloading ADA resources. Using device: %s", device)
+        client = genai.Client(api_key=GOOGLE_API_KEY)
+        try:
+            # Opens the Gemini HTTP connection so the first user turn does not pay for it
+            await asyncio.wait_for(client.aio.models.get(model=GEMINI_MODEL), GEMINI_WARMUP_TIMEOUT)
+        except TimeoutError:
+            log.warning("Gemini warm-up request timed out after %ss (will connect on first use).", GEMINI_WARMUP_TIMEOUT)
+        except Exception as e:
+            log.warning("Gemini warm-up request failed (will connect on first use): %r", e)
+        return {'device': device, 'client': client}
+
+    def emit_coalesced(self, event, chunk):
+        """ Buffers a streamed text (str) or audio (bytes) chunk and emits everything gathered within COALESCE_WINDOW as one message. """
+        pending = self.coalesced_chunks.setdefault(event, [])
+        pending.append(chunk)
+        if len(pending) == 1: # First chunk of this window schedules the flush
+            asyncio.get_running_loop().call_later(COALESCE_WINDOW, self._flush_coalesced, event)
+
+    def _flush_coalesced(self, event):
+        chunks = self.coalesced_chunks.pop(event, None)
+        if not chunks or not (self.socketio and self.client_sid):
+            return
+        if isinstance(chunks[0], bytes):
+            data = base64.b64encode(b"".join(chunks)).decode('utf-8')
+        else:
+            data = "".join(chunks)
+        self.socketio.emit(event, {COALESCED_EVENTS[event]: data}, room=self.client_sid)
+
     async def get_weather(self, location: str) -> dict | None:
         """ Fetches current weather and emits update via SocketIO. """
         async with python_weather.Client(unit=python_weather.IMPERIAL) as client:
@@ -138,28 +182,28 @@ class ADA:
                     'precipitation': weather.precipitation, # Added precipitation
                     'description': weather.description,
                 }
-                print(f"Weather data fetched: {weather_data}")
+                log.debug("Weather data fetched: %s", weather_data)
 
                 # --- Emit weather_update from here ---
                 if self.socketio and self.client_sid:
-                    print(f"--- Emitting weather_update event for SID: {self.client_sid} ---")
+                    log.debug("Emitting weather_update event for SID: %s", self.client_sid)
                     self.socketio.emit('weather_update', weather_data, room=self.client_sid)
                 # --- End Emit ---
 
                 return weather_data # Still return data for Gemini
 
             except Exception as e:
-                print(f"Error fetching weather for {location}: {e}")
+                log.error("Error fetching weather for %s: %s", location, e)
                 return {"error": f"Could not fetch weather for {location}."} # Return error info
 
     def _sync_get_travel_duration(self, origin: str, destination: str, mode: str = "driving") -> str:
          if not self.Maps_api_key or self.Maps_api_key == "YOUR_PROVIDED_KEY": # Check the actual key
-            print("Error: Google Maps API Key is missing or invalid.")
+            log.error("Google Maps API Key is missing or invalid.")
             return "Error: Missing or invalid Google Maps API Key configuration."
          try:
             gmaps = googlemaps.Client(key=self.Maps_api_key)
             now = datetime.now()
-            print(f"Requesting directions: From='{origin}', To='{destination}', Mode='{mode}'")
+            log.info("Requesting directions: From='%s', To='%s', Mode='%s'", origin, destination, mode)
             directions_result = gmaps.directions(origin, destination, mode=mode, departure_time=now)
             if directions_result:
                 leg = directions_result[0]['legs'][0]
@@ -172,18 +216,18 @@ class ADA:
                      result = f"Estimated travel duration ({mode}): {duration_text}"
                 else:
                     result = f"Duration information not found in response for {mode}."
-                print(f"Directions Result: {result}")
+                log.debug("Directions Result: %s", result)
                 return result
             else:
-                print(f"No route found from {origin} to {destination} via {mode}.")
+                log.info("No route found from %s to %s via %s.", origin, destination, mode)
                 return f"Could not find a route from {origin} to {destination} via {mode}."
          except Exception as e:
-            print(f"An unexpected error occurred during travel duration lookup: {e}")
+            log.error("An unexpected error occurred during travel duration lookup: %s", e)
             return f"An unexpected error occurred: {e}"
 
     async def get_travel_duration(self, origin: str, destination: str, mode: str = "driving") -> dict:
         """ Async wrapper to get travel duration and emit map update via SocketIO. """
-        print(f"Received request for travel duration from: {origin} to: {destination}, Mode: {mode}")
+        log.info("Received request for travel duration from: %s to: %s, Mode: %s", origin, destination, mode)
         if not mode:
             mode = "driving"
 
@@ -198,14 +242,14 @@ class ADA:
                     'destination': destination,
                     'origin': origin
                 }
-                print(f"--- Emitting map_update event for SID: {self.client_sid} ---")
+                log.debug("Emitting map_update event for SID: %s", self.client_sid)
                 self.socketio.emit('map_update', map_payload, room=self.client_sid)
             # --- End Emit ---
 
             return {"duration_result": result_string} # Still return result for Gemini
 
         except Exception as e:
-            print(f"Error calling _sync_get_travel_duration via to_thread: {e}")
+            log.error("Error calling _sync_get_travel_duration via to_thread: %s", e)
             return {"duration_result": f"Failed to execute travel duration request: {e}"}
 
     async def _fetch_and_extract_snippet(self, session, url: str) -> dict | None:
@@ -258,10 +302,10 @@ class ADA:
                              page_text_summary = "No paragraph text found on page."
 
                     except Exception as text_ex:
-                        print(f"  Error extracting paragraph text from {url}: {text_ex}")
+                        log.error("Error extracting paragraph text from %s: %s", url, text_ex)
                         # Keep default "Could not extract..." message
 
-                    print(f"  Extracted: Title='{title}', Snippet='{snippet[:50]}...', Text='{page_text_summary[:50]}...' from {url}")
+                    log.debug("Extracted: Title='%s', Snippet='%s...', Text='%s...' from %s", title, snippet[:50], page_text_summary[:50], url)
                     # --- Return enriched dictionary ---
                     return {
                         "url": url,
@@ -270,29 +314,29 @@ class ADA:
                         "page_content_summary": page_text_summary # Added page text
                     }
                 else:
-                    print(f"  Failed to fetch {url}: Status {response.status}")
+                    log.error("Failed to fetch %s: Status %s", url, response.status)
                     return None # Return None on non-200 status
 
         # --- Keep existing error handling ---
         except asyncio.TimeoutError:
-            print(f"  Timeout fetching {url}")
+            log.warning("Timeout fetching %s", url)
         except aiohttp.ClientError as e:
-            print(f"  ClientError fetching {url}: {e}")
+            log.error("ClientError fetching %s: %s", url, e)
         except Exception as e:
-            print(f"  Error processing {url}: {e}")
+            log.error("Error processing %s: %s", url, e)
 
         # Return None if any exception occurred before successful extraction
         return None
     
     def _sync_Google_Search(self, query: str, num_results: int = 5) -> list:
         # ... (keep the previous working version that returns URLs) ...
-        print(f"Performing synchronous Google search for: '{query}'")
+        log.info("Performing synchronous Google search for: '%s'", query)
         try:
             results = list(Google_Search_sync(term=query, num_results=num_results, lang="en", timeout=1))
-            print(f"Found {len(results)} results.")
+            log.info("Found %s results.", len(results))
             return results
         except Exception as e:
-            print(f"Error during Google search for '{query}': {e}")
+            log.error("Error during Google search for '%s': %s", query, e)
             return []
 
 # Inside the ADA class in server/ADA_Online.py
@@ -304,7 +348,7 @@ class ADA:
         Emits results via SocketIO.
         Returns a dictionary containing a list of result objects.
         """
-        print(f"Received request for Google search with page content fetch: '{query}'")
+        log.info("Received request for Google search with page content fetch: '%s'", query)
         fetched_results = [] # This will store dicts: {"url":..., "title":..., "meta_snippet":..., "page_content_summary":...}
         try:
             # Step 1: Get URLs (no change)
@@ -312,16 +356,16 @@ class ADA:
                 self._sync_Google_Search, query, num_results=5
             )
             if not search_urls:
-                print("No URLs found by Google Search.")
+                log.info("No URLs found by Google Search.")
                 # --- EMIT EMPTY RESULTS TO FRONTEND ---
                 if self.socketio and self.client_sid:
-                    print(f"--- Emitting empty search_results_update event for SID: {self.client_sid} ---")
+                    log.debug("Emitting empty search_results_update event for SID: %s", self.client_sid)
                     self.socketio.emit('search_results_update', {"results": [], "query": query}, room=self.client_sid)
                 # --- END EMIT ---
                 return {"results": []} # Return for Gemini
 
             # Step 2: Fetch content concurrently (no change in logic)
-            print(f"Fetching content for {len(search_urls)} URLs...")
+            log.info("Fetching content for %s URLs...", len(search_urls))
             async with aiohttp.ClientSession() as session:
                 tasks = [self._fetch_and_extract_snippet(session, url) for url in search_urls]
                 results_from_gather = await asyncio.gather(*tasks, return_exceptions=True)
@@ -331,14 +375,14 @@ class ADA:
                 if isinstance(result, dict): # Successfully fetched data
                     fetched_results.append(result)
                 elif isinstance(result, Exception):
-                    print(f"   An error occurred during content fetching task: {result}")
+                    log.error("An error occurred during content fetching task: %s", result)
                 # else: result is None (fetch/parse failed, already logged in helper)
 
-            print(f"Finished fetching content. Got {len(fetched_results)} results.")
+            log.info("Finished fetching content. Got %s results.", len(fetched_results))
 
             # --- **** NEW: EMIT RESULTS TO FRONTEND **** ---
             if self.socketio and self.client_sid:
-                 print(f"--- Emitting search_results_update event with {len(fetched_results)} results for SID: {self.client_sid} ---")
+                 log.debug("Emitting search_results_update event with %s results for SID: %s", len(fetched_results), self.client_sid)
                  # Send the query along with the results for context
                  emit_payload = {"query": query, "results": fetched_results}
                  self.socketio.emit('search_results_update', emit_payload, room=self.client_sid)
@@ -346,7 +390,7 @@ class ADA:
 
 
         except Exception as e:
-            print(f"Error running get_search_results for '{query}': {e}")
+            log.error("Error running get_search_results for '%s': %s", query, e)
             # Optionally emit an error event to the frontend here as well
             if self.socketio and self.client_sid:
                  self.socketio.emit('search_results_error', {"query": query, "error": str(e)}, room=self.client_sid)
@@ -356,7 +400,7 @@ class ADA:
         response_payload = {
             "results": fetched_results
         }
-        print(f"Custom Google search function for '{query}' returning {len(fetched_results)} processed results to Gemini.")
+        log.info("Custom Google search function for '%s' returning %s processed results to Gemini.", query, len(fetched_results))
         return response_payload
     
     async def clear_queues(self, text=""):
@@ -370,19 +414,22 @@ class ADA:
 
     async def process_input(self, message, is_final_turn_input=False):
         """ Puts message and flag into the input queue. """
-        print(f"Processing input: '{message}', Final Turn: {is_final_turn_input}")
+        log.debug("Processing input: '%s', Final Turn: %s", message, is_final_turn_input)
         if is_final_turn_input:
              await self.clear_queues() # Clear only before final input
         await self.input_queue.put((message, is_final_turn_input))
 
-    async def process_video_frame(self, frame_data_url):
-        """ Processes incoming video frame data URL """
-        self.latest_video_frame_data_url = frame_data_url
-        frame_data_url = None
+    async def process_video_frame(self, frame_bytes: bytes, mime_type: str = "image/jpeg"):
+        """ Processes incoming decoded video frame bytes """
+        self.latest_video_frame = (frame_bytes, mime_type)
+
+    async def clear_video_queue(self):
+        """ Drops the stored video frame once the client's video feed stops """
+        self.latest_video_frame = None
 
     async def run_gemini_session(self):
         """Manages the Gemini conversation session, handling text, video, and tool calls."""
-        print("Starting Gemini session manager...")
+        log.info("Starting Gemini session manager...")
         try:
             while True: # Loop to process text inputs from the input_queue
                 message, is_final_turn_input = await self.input_queue.get()
@@ -391,25 +438,22 @@ class ADA:
                     self.input_queue.task_done() # Mark non-final/empty messages as done
                     continue # Skip processing if not final input
 
-                print(f"Sending FINAL input to Gemini: {message}")
+                log.info("Sending FINAL input to Gemini: %s", message)
 
                 # --- Prepare Content for Gemini ---
                 request_content = [message]
-                if self.latest_video_frame_data_url:
+                if self.latest_video_frame:
                     try:
-                        header, encoded = self.latest_video_frame_data_url.split(",", 1)
-                        # Determine mime type from header (e.g., "data:image/jpeg;base64")
-                        mime_type = header.split(':')[1].split(';')[0] if ':' in header and ';' in header else "image/jpeg" # Default or parse
-                        frame_bytes = base64.b64decode(encoded)
+                        frame_bytes, mime_type = self.latest_video_frame
                         request_content.append(types.Part.from_bytes(data=frame_bytes, mime_type=mime_type))
-                        print(f"Included image frame with mime_type: {mime_type}")
+                        log.debug("Included image frame with mime_type: %s", mime_type)
                     except Exception as e:
-                        print(f"Error processing video frame data URL: {e}")
+                        log.error("Error processing video frame: %s", e)
                     finally:
-                         self.latest_video_frame_data_url = None # Clear after use/attempt
+                         self.latest_video_frame = None # Clear after use/attempt
 
                 # --- 1. Send Initial Request and Process First Response Stream ---
-                print("--- Sending request to Gemini ---")
+                log.info("Sending request to Gemini")
                 response_stream = await self.chat.send_message_stream(request_content)
 
                 collected_function_calls = [] # Store detected function calls for later processing
@@ -423,18 +467,17 @@ class ADA:
 
                     for part in chunk.candidates[0].content.parts:
                         if part.function_call:
-                            print(f"--- Detected Function Call: {part.function_call.name} ---")
+                            log.info("Detected Function Call: %s", part.function_call.name)
                             collected_function_calls.append(part.function_call) # Store the call details
                         elif part.text:
                             # Stream text parts immediately for TTS
                             await self.response_queue.put(part.text)
-                            if self.socketio and self.client_sid:
-                                self.socketio.emit('receive_text_chunk', {'text': part.text}, room=self.client_sid)
+                            self.emit_coalesced('receive_text_chunk', part.text)
                             processed_text_in_turn = True
 
                 # --- 2. Handle Function Calls (if any were detected) ---
                 if collected_function_calls:
-                    print(f"--- Processing {len(collected_function_calls)} detected function call(s) ---")
+                    log.info("Processing %s detected function call(s)", len(collected_function_calls))
                     function_response_parts = []
 
                     # Note: Currently handles multiple calls sequentially. Could be parallelized.
@@ -444,11 +487,11 @@ class ADA:
 
                         if tool_call_name in self.available_functions:
                             function_to_call = self.available_functions[tool_call_name]
-                            print(f"Executing function: {tool_call_name} with args: {tool_call_args}")
+                            log.info("Executing function: %s with args: %s", tool_call_name, tool_call_args)
                             try:
                                 # Execute the function
                                 function_result = await function_to_call(**tool_call_args)
-                                print(f"Function {tool_call_name} returned: {function_result}")
+                                log.debug("Function %s returned: %s", tool_call_name, function_result)
 
                                 response_payload = function_result 
 
@@ -459,7 +502,7 @@ class ADA:
                                     )
                                 )
                             except Exception as e:
-                                print(f"!!! Error calling function {tool_call_name}: {e} !!!")
+                                log.error("Error calling function %s: %s", tool_call_name, e)
                                 # Handle error - maybe send an error response back?
                                 # For now, we might skip adding a response part or add an error part
                                 function_response_parts.append(
@@ -469,7 +512,7 @@ class ADA:
                                     )
                                 )
                         else:
-                            print(f"!!! Error: Function '{tool_call_name}' is not available. !!!")
+                            log.error("Function '%s' is not available.", tool_call_name)
                             # Handle missing function - inform Gemini
                             function_response_parts.append(
                                 types.Part.from_function_response(
@@ -480,7 +523,7 @@ class ADA:
 
                     # --- 3. Send Function Response(s) Back to Gemini ---
                     if function_response_parts:
-                        print(f"--- Sending {len(function_response_parts)} function response(s) back to Gemini ---")
+                        log.info("Sending %s function response(s) back to Gemini", len(function_response_parts))
                         response_stream_after_func = await self.chat.send_message_stream(function_response_parts) # Send ONLY the response parts
 
                         # --- 4. Process Final Text Response from Gemini ---
@@ -489,24 +532,20 @@ class ADA:
                                 for part in final_chunk.candidates[0].content.parts:
                                      if part.text:
                                         await self.response_queue.put(part.text)
-                                        if self.socketio and self.client_sid:
-                                            self.socketio.emit('receive_text_chunk', {'text': part.text}, room=self.client_sid)
+                                        self.emit_coalesced('receive_text_chunk', part.text)
                                         processed_text_in_turn = True
                         self.response_queue.put("")
 
                 # --- 5. Signal End of Response to TTS ---
-                print("--- Finished processing response for this turn. Signaling TTS end. ---")
+                log.info("Finished processing response for this turn. Signaling TTS end.")
                 await self.response_queue.put(None) # Use None as a sentinel for the TTS loop
 
                 self.input_queue.task_done() # Mark input processed
 
         except asyncio.CancelledError:
-            print("Gemini session task cancelled.")
+            log.info("Gemini session task cancelled.")
         except Exception as e:
-            print(f"!!! Error in Gemini session manager: {e} !!!")
-            # Log the full traceback for debugging
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in Gemini session manager: %s", e) # Includes the full traceback
             if self.socketio and self.client_sid:
                 self.socketio.emit('error', {'message': f'Gemini session error: {str(e)}'}, room=self.client_sid)
             # Try to signal TTS end even on error, might help cleanup
@@ -515,22 +554,22 @@ class ADA:
             except Exception:
                  pass # Ignore errors during error handling cleanup
         finally:
-            print("Gemini session manager finished.")
+            log.info("Gemini session manager finished.")
             # Clean up video task if necessary (keep existing finally block logic)
             video_task = next((t for t in self.tasks if hasattr(t, 'get_coro') and t.get_coro().__name__ == 'run_video_sender'), None)
             if video_task and not video_task.done():
-                 print("Cancelling video sender task from Gemini session finally block.")
+                 log.info("Cancelling video sender task from Gemini session finally block.")
                  video_task.cancel()
             self.gemini_session = None # Assuming this was meant to be self.chat? Or track session state elsewhere.
 
     async def run_tts_and_audio_out(self):
-        print("Starting TTS and Audio Output manager...")
+        log.info("Starting TTS and Audio Output manager...")
         uri = f"wss://api.elevenlabs.io/v1/text-to-speech/{VOICE_ID}/stream-input?model_id=eleven_flash_v2_5&output_format=pcm_24000"
         while True:
             try:
                 async with websockets.connect(uri) as websocket:
                     self.tts_websocket = websocket
-                    print("ElevenLabs WebSocket Connected.")
+                    log.info("ElevenLabs WebSocket Connected.")
                     await websocket.send(json.dumps({"text": " ", "voice_settings": {"stability": 0.3, "similarity_boost": 0.9, "speed": 1.1}, "xi_api_key": ELEVENLABS_API_KEY,}))
                     async def tts_listener():
                         try:
@@ -539,36 +578,35 @@ class ADA:
                                 data = json.loads(message)
                                 if data.get("audio"):
                                     audio_chunk = base64.b64decode(data["audio"])
-                                    if self.socketio and self.client_sid:
-                                        self.socketio.emit('receive_audio_chunk', {'audio': base64.b64encode(audio_chunk).decode('utf-8')}, room=self.client_sid)
+                                    self.emit_coalesced('receive_audio_chunk', audio_chunk)
                                 elif data.get('isFinal'): pass
-                        except websockets.exceptions.ConnectionClosedOK: print("TTS WebSocket listener closed normally.")
-                        except websockets.exceptions.ConnectionClosedError as e: print(f"TTS WebSocket listener closed error: {e}")
-                        except asyncio.CancelledError: print("TTS listener task cancelled.")
-                        except Exception as e: print(f"Error in TTS listener: {e}")
+                        except websockets.exceptions.ConnectionClosedOK: log.info("TTS WebSocket listener closed normally.")
+                        except websockets.exceptions.ConnectionClosedError as e: log.error("TTS WebSocket listener closed error: %s", e)
+                        except asyncio.CancelledError: log.info("TTS listener task cancelled.")
+                        except Exception as e: log.error("Error in TTS listener: %s", e)
                         finally: self.tts_websocket = None
                     listener_task = asyncio.create_task(tts_listener())
                     try:
                         while True:
                             text_chunk = await self.response_queue.get()
                             if text_chunk is None:
-                                print("End of text stream signal received for TTS.")
+                                log.info("End of text stream signal received for TTS.")
                                 await websocket.send(json.dumps({"text": ""}))
                                 break
                             await websocket.send(json.dumps({"text": text_chunk}))
-                            print(f"Sent text to TTS: {text_chunk}")
+                            log.debug("Sent text to TTS: %s", text_chunk)
                             #self.response_queue.task_done()
-                    except asyncio.CancelledError: print("TTS sender task cancelled.")
-                    except Exception as e: print(f"Error sending text to TTS: {e}")
+                    except asyncio.CancelledError: log.info("TTS sender task cancelled.")
+                    except Exception as e: log.error("Error sending text to TTS: %s", e)
                     finally:
                         if listener_task and not listener_task.done():
                             try:
                                 if not listener_task.cancelled(): await asyncio.wait_for(listener_task, timeout=5.0)
-                            except asyncio.TimeoutError: print("Timeout waiting for TTS listener.")
-                            except asyncio.CancelledError: print("TTS listener task already cancelled.")
-            except websockets.exceptions.ConnectionClosedError as e: print(f"ElevenLabs WebSocket connection error: {e}. Reconnecting..."); await asyncio.sleep(5)
-            except asyncio.CancelledError: print("TTS main task cancelled."); break
-            except Exception as e: print(f"Error in TTS main loop: {e}"); await asyncio.sleep(5)
+                            except asyncio.TimeoutError: log.warning("Timeout waiting for TTS listener.")
+                            except asyncio.CancelledError: log.info("TTS listener task already cancelled.")
+            except websockets.exceptions.ConnectionClosedError as e: log.error("ElevenLabs WebSocket connection error: %s. Reconnecting...", e); await asyncio.sleep(5)
+            except asyncio.CancelledError: log.info("TTS main task cancelled."); break
+            except Exception as e: log.error("Error in TTS main loop: %s", e); await asyncio.sleep(5)
             finally:
                  if self.tts_websocket:
                      try: await self.tts_websocket.close()
@@ -576,7 +614,7 @@ class ADA:
                  self.tts_websocket = None
 
     async def start_all_tasks(self):
-        print("Starting ADA background tasks...")
+        log.info("Starting ADA background tasks...")
         if not self.tasks:
             loop = asyncio.get_running_loop()
             gemini_task = loop.create_task(self.run_gemini_session())
@@ -586,12 +624,12 @@ class ADA:
             if hasattr(self, 'video_frame_queue'):
                video_sender_task = loop.create_task(self.run_video_sender())
                self.tasks.append(video_sender_task)
-            print(f"ADA Core Tasks started: {len(self.tasks)}")
+            log.info("ADA Core Tasks started: %s", len(self.tasks))
         else:
-            print("ADA tasks already running.")
+            log.info("ADA tasks already running.")
 
     async def stop_all_tasks(self):
-        print("Stopping ADA background tasks...")
+        log.info("Stopping ADA background tasks...")
         tasks_to_cancel = list(self.tasks)
         for task in tasks_to_cancel:
             if task and not task.done(): task.cancel()
@@ -599,7 +637,7 @@ class ADA:
         self.tasks = []
         if self.tts_websocket:
             try: await self.tts_websocket.close(code=1000)
-            except Exception as e: print(f"Error closing TTS websocket during stop: {e}")
+            except Exception as e: log.error("Error closing TTS websocket during stop: %s", e)
             finally: self.tts_websocket = None
         self.gemini_session = None
-        print("ADA tasks stopped.")
\ No newline at end of file
+        log.info("ADA tasks stopped.")
\ No newline at end of file
@@ -1,13 +1,41 @@
 # app.py (Revised for Client-Side STT, CORS, Logging, AND VIDEO FRAMES)
+import eventlet
+eventlet.monkey_patch() # Must run before flask/threading are imported so sockets become green
+
 import os
+import atexit
 from dotenv import load_dotenv
 import asyncio
-import threading
+import logging
+import sys
+from logging.handlers import QueueHandler, QueueListener
+# Unpatched threading, for the few workers that must stay real OS threads (the log listener)
+os_threading = eventlet.patcher.original('threading')
 from flask import Flask, render_template, request # Make sure request is imported
 from flask_socketio import SocketIO, emit
 
 load_dotenv()
+
+class _OSThreadQueueListener(QueueListener):
+    """ QueueListener whose worker stays a real OS thread under eventlet, so blocking writes never stall the hub """
+    def start(self):
+        self._thread = os_threading.Thread(target=self._monitor, daemon=True)
+        self._thread.start()
+
+# Handlers only enqueue records; the listener thread does the actual write(2),
+# so neither the asyncio loop thread nor the Socket.IO greenlets block on stderr.
+_log_queue = eventlet.patcher.original('queue').Queue(-1)
+_log_stream_handler = logging.StreamHandler(sys.stderr)
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+log_listener = _OSThreadQueueListener(_log_queue, _log_stream_handler)
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+logging.getLogger().setLevel(os.getenv('LOG_LEVEL', 'INFO').upper()) # Production (wsgi.py) defaults to WARNING
+log_listener.start()
+atexit.register(log_listener.stop) # Flushes queued records on interpreter exit
+log = logging.getLogger('ada.server')
+
 from ADA_Online import ADA # Make sure filename matches ADA_Online.py
+import fast_json
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'a_default_fallback_secret_key!')
@@ -15,119 +43,198 @@ app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'a_default_fallback_sec
 REACT_APP_PORT = os.getenv('REACT_APP_PORT', '5173')
 REACT_APP_ORIGIN = f"http://localhost:{REACT_APP_PORT}"
 REACT_APP_ORIGIN_IP = f"http://127.0.0.1:{REACT_APP_PORT}"
+ALLOWED_ORIGINS = frozenset((REACT_APP_ORIGIN, REACT_APP_ORIGIN_IP)) # Hashed membership check per handshake
 
 socketio = SocketIO(
     app,
-    async_mode='threading',
-    cors_allowed_origins=[REACT_APP_ORIGIN, REACT_APP_ORIGIN_IP]
+    async_mode='eventlet',
+    cors_allowed_origins=ALLOWED_ORIGINS,
+    ping_interval=30,
+    ping_timeout=20,
+    # Under eventlet this is also the WebSocket max frame length: an oversized frame closes the
+    # connection (and a reconnect gets a fresh ADA), so leave room for native-resolution JPEGs.
+    max_http_buffer_size=2 * 1024 * 1024,
+    json=fast_json # orjson for every text event encoded/decoded
 )
 
-ada_instance = None
-ada_loop = None
-ada_thread = None
+class _NoWebSocketDeflate:
+    """ WSGI wrapper that hides the client's Sec-WebSocket-Extensions offer, so the eventlet
+    WebSocket server never negotiates permessage-deflate (JPEG frames gain nothing from zlib) """
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
 
-def run_asyncio_loop(loop):
-    """ Function to run the asyncio event loop in a separate thread """
-    asyncio.set_event_loop(loop)
+    def __call__(self, environ, start_response):
+        environ.pop('HTTP_SEC_WEBSOCKET_EXTENSIONS', None)
+        return self.wsgi_app(environ, start_response)
+
+app.wsgi_app = _NoWebSocketDeflate(app.wsgi_app) # Wraps the Socket.IO middleware installed by SocketIO(app)
+
+ada_instances = {} # One ADA per connected Socket.IO SID
+ada_loop = None # Shared asyncio loop hosting every ADA instance
+ada_loop_task = None # Background task (a greenlet under eventlet) running ada_loop
+ada_inbox = None # asyncio.Queue of (kind, sid, payload) events posted by the Socket.IO handlers ('drain_frames' has sid None)
+ada_stop_event = None # asyncio.Event set (via call_soon_threadsafe) to shut the loop down
+ada_resources = None # Shared resources from ADA.preload_models(), built once at startup
+
+# Latest-wins video forwarding: each SID holds at most one pending frame, and a newer frame
+# replaces an older one that ADA has not taken yet, so slow Gemini turns cannot grow a backlog.
+_pending_frames = {} # SID -> (frame_bytes, mime_type)
+_frame_inflight = False
+_rejected_frame_sids = set() # SIDs already warned about non-binary frames (warn once, not per frame)
+
+async def _forward_pending_frames():
+    """ Runs on the asyncio loop: hands each SID's newest pending frame to its ADA until none are left """
+    global _frame_inflight
     try:
-        print("Asyncio event loop started...")
-        loop.run_forever()
+        while True:
+            while _pending_frames:
+                client_sid, frame = _pending_frames.popitem()
+                ada = ada_instances.get(client_sid)
+                if ada:
+                    await ada.process_video_frame(*frame)
+            _frame_inflight = False
+            # A frame may have landed after the inner loop emptied the dict but before the flag was cleared
+            if not _pending_frames:
+                break
+            _frame_inflight = True
     finally:
-        print("Asyncio event loop stopping...")
-        tasks = asyncio.all_tasks(loop=loop)
-        for task in tasks:
-            if not task.done():
-                task.cancel()
+        _frame_inflight = False # Never leave it stuck (raise/cancel), or no client's video is forwarded again
+
+def _post_to_ada(kind, client_sid, payload=None):
+    """ Hands an event to the asyncio loop without allocating a Future per event """
+    ada_loop.call_soon_threadsafe(ada_inbox.put_nowait, (kind, client_sid, payload))
+
+async def _consume_inbox():
+    """ Single consumer on the asyncio loop: dispatches every event posted through _post_to_ada """
+    while True:
+        kind, client_sid, payload = await ada_inbox.get()
         try:
-            loop.run_until_complete(asyncio.gather(*[t for t in tasks if not t.done()], return_exceptions=True))
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except RuntimeError as e:
-             print(f"RuntimeError during loop cleanup (might be expected if loop stopped abruptly): {e}")
+            if kind == 'drain_frames': # Global: forwards every SID's pending frame, not just one client's
+                await _forward_pending_frames()
+                continue
+            ada = ada_instances.get(client_sid)
+            if not ada:
+                log.debug("Dropping %s event for SID %s: no ADA instance.", kind, client_sid)
+            elif kind == 'input':
+                # Process input with end_of_turn=True implicitly handled in process_input -> run_gemini_session
+                await ada.process_input(payload, is_final_turn_input=True)
+            elif kind == 'video_stopped':
+                await ada.clear_video_queue()
         except Exception as e:
-            print(f"Exception during loop cleanup: {e}")
-        finally:
-            if not loop.is_closed():
-                loop.close()
-        print("Asyncio event loop stopped.")
+            log.error("Error dispatching %s event for SID %s: %s", kind, client_sid, e)
+
+async def _ada_loop_main():
+    """ Top-level coroutine of the ADA loop: runs the inbox consumer until shutdown is requested """
+    consumer = asyncio.create_task(_consume_inbox())
+    await ada_stop_event.wait()
+    consumer.cancel() # Runner.close() cancels and awaits whatever else is still pending (ADA tasks)
+
+def run_asyncio_loop(loop):
+    """ Runs the asyncio event loop as a Socket.IO background task, cooperating with the eventlet hub """
+    log.info("Asyncio event loop started...")
+    try:
+        # Runner owns shutdown: cancels leftover tasks, closes async generators and the executor, then the loop
+        with asyncio.Runner(debug=False, loop_factory=lambda: loop) as runner:
+            runner.run(_ada_loop_main())
+    except Exception as e:
+        log.error("Asyncio event loop exited with an error: %s", e)
+    log.info("Asyncio event loop stopped.")
+
+async def _stop_with_timeout(ada, client_sid, timeout=10.0):
+    """ Stops an ADA instance's tasks on the loop, bounding the wait without blocking the caller """
+    try:
+        await asyncio.wait_for(ada.stop_all_tasks(), timeout)
+        log.info("ADA tasks stopped successfully for SID %s.", client_sid)
+    except TimeoutError:
+        log.warning("Timeout waiting for ADA tasks to stop for SID %s.", client_sid)
+    except Exception as e:
+        log.error("Exception during ADA task stop for SID %s: %s", client_sid, e)
+
+def _ensure_ada_loop():
+    """ Starts the shared asyncio loop as a background task unless it is already running.
+
+    No lock needed: handlers are greenlets on one OS thread, and nothing between the is_closed()
+    check and the ada_loop assignment yields, so two connects cannot both start a loop. """
+    global ada_loop, ada_loop_task, ada_inbox, ada_stop_event, _frame_inflight
+    if ada_loop is None or ada_loop.is_closed():
+        log.info("Asyncio loop not running. Starting new loop as a background task.")
+        ada_loop = asyncio.new_event_loop()
+        ada_inbox = asyncio.Queue()
+        ada_stop_event = asyncio.Event()
+        _frame_inflight = False # A 'drain_frames' event posted to the old loop's inbox died with it
+        ada_loop_task = socketio.start_background_task(run_asyncio_loop, ada_loop)
+        log.info("Started asyncio loop task.")
+        socketio.sleep(0.1) # First yield point; ada_loop is already assigned
+
+def init_ada():
+    """ Starts the asyncio loop and prewarms ADA's shared resources before the server accepts connections """
+    global ada_resources
+    _ensure_ada_loop()
+    future = asyncio.run_coroutine_threadsafe(ADA.preload_models(), ada_loop)
+    try:
+        ada_resources = future.result(timeout=30)
+        log.info("ADA resources preloaded.")
+    except TimeoutError:
+        future.cancel() # Otherwise the warm-up keeps running on the shared loop for the life of the process
+        log.error("Timed out after 30s preloading ADA resources; instances will build their own.")
+    except Exception as e:
+        log.error("Failed to preload ADA resources; instances will build their own: %r", e)
+
 
 @socketio.on('connect')
 def handle_connect():
     """ Handles new client connections """
-    global ada_instance, ada_loop, ada_thread
     client_sid = request.sid
-    print(f"\n--- handle_connect called for SID: {client_sid} ---")
+    log.info("handle_connect called for SID: %s", client_sid)
 
-    if ada_thread is None or not ada_thread.is_alive():
-        print(f"    Asyncio thread not running. Starting new loop and thread.")
-        ada_loop = asyncio.new_event_loop()
-        ada_thread = threading.Thread(target=run_asyncio_loop, args=(ada_loop,), daemon=True)
-        ada_thread.start()
-        print("    Started asyncio thread.")
-        socketio.sleep(0.1)
-
-    if ada_instance is None:
-        print(f"    Creating NEW ADA instance for SID: {client_sid}")
-        if not ada_loop or not ada_loop.is_running():
-             print(f"    ERROR: Cannot create ADA instance, asyncio loop not ready for SID {client_sid}.")
-             emit('error', {'message': 'Assistant initialization error (loop).'}, room=client_sid)
-             return
+    _ensure_ada_loop()
 
-        try:
-            ada_instance = ADA(socketio_instance=socketio, client_sid=client_sid)
-            future = asyncio.run_coroutine_threadsafe(ada_instance.start_all_tasks(), ada_loop)
-            print("    ADA instance created and tasks scheduled.")
-        except ValueError as e:
-            print(f"    ERROR initializing ADA (ValueError) for SID {client_sid}: {e}")
-            emit('error', {'message': f'Failed to initialize assistant: {e}'}, room=client_sid)
-            ada_instance = None
-            return
-        except Exception as e:
-            print(f"    ERROR initializing ADA (Unexpected) for SID {client_sid}: {e}")
-            emit('error', {'message': f'Unexpected error initializing assistant: {e}'}, room=client_sid)
-            ada_instance = None
-            return
-    else:
-        print(f"    ADA instance already exists. Updating SID from {ada_instance.client_sid} to {client_sid}")
-        ada_instance.client_sid = client_sid
+    if not ada_loop or not ada_loop.is_running():
+        log.error("Cannot create ADA instance, asyncio loop not ready for SID %s.", client_sid)
+        emit('error', {'message': 'Assistant initialization error (loop).'}, room=client_sid)
+        return
 
-    if ada_instance:
-        emit('status', {'message': 'Connected to ADA Assistant'}, room=client_sid)
-    print(f"--- handle_connect finished for SID: {client_sid} ---\n")
+    log.info("Creating NEW ADA instance for SID: %s", client_sid)
+    try:
+        ada = ADA(socketio_instance=socketio, client_sid=client_sid, prewarmed_resources=ada_resources)
+        ada_instances[client_sid] = ada
+        asyncio.run_coroutine_threadsafe(ada.start_all_tasks(), ada_loop)
+        log.info("ADA instance created and tasks scheduled.")
+    except ValueError as e:
+        log.error("Error initializing ADA (ValueError) for SID %s: %s", client_sid, e)
+        emit('error', {'message': f'Failed to initialize assistant: {e}'}, room=client_sid)
+        return
+    except Exception as e:
+        log.error("Error initializing ADA (Unexpected) for SID %s: %s", client_sid, e)
+        emit('error', {'message': f'Unexpected error initializing assistant: {e}'}, room=client_sid)
+        return
+
+    emit('status', {'message': 'Connected to ADA Assistant'}, room=client_sid)
+    log.debug("handle_connect finished for SID: %s", client_sid)
 
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """ Handles client disconnections """
-    global ada_instance
     client_sid = request.sid
-    print(f"\n--- handle_disconnect called for SID: {client_sid} ---")
+    log.info("handle_disconnect called for SID: %s", client_sid)
 
-    if ada_instance and ada_instance.client_sid == client_sid:
-        print(f"    Designated client {client_sid} disconnected. Attempting to stop ADA.")
+    ada = ada_instances.pop(client_sid, None)
+    _pending_frames.pop(client_sid, None)
+    _rejected_frame_sids.discard(client_sid)
+    if ada:
+        log.info("Client %s disconnected. Attempting to stop its ADA instance.", client_sid)
         if ada_loop and ada_loop.is_running():
-            future = asyncio.run_coroutine_threadsafe(ada_instance.stop_all_tasks(), ada_loop)
-            try:
-                future.result(timeout=10)
-                print("    ADA tasks stopped successfully.")
-            except TimeoutError:
-                print("    Timeout waiting for ADA tasks to stop.")
-            except Exception as e:
-                print(f"    Exception during ADA task stop: {e}")
-            finally:
-                 pass # Keep loop running
-
+            # Fire and forget: blocking on the result here would stall every other client's greenlet
+            asyncio.run_coroutine_threadsafe(_stop_with_timeout(ada, client_sid), ada_loop)
         else:
-             print(f"    Cannot stop ADA tasks: asyncio loop not available or not running.")
-
-        ada_instance = None
-        print("    ADA instance cleared.")
+             log.warning("Cannot stop ADA tasks: asyncio loop not available or not running.")
 
-    elif ada_instance:
-         print(f"    Disconnecting client {client_sid} is NOT the designated client ({ada_instance.client_sid}). ADA remains active.")
+        log.info("ADA instance cleared; its tasks are stopping in the background.")
     else:
-         print(f"    Client {client_sid} disconnected, but no active ADA instance found.")
+         log.info("Client %s disconnected, but no active ADA instance found.", client_sid)
 
-    print(f"--- handle_disconnect finished for SID: {client_sid} ---\n")
+    log.debug("handle_disconnect finished for SID: %s", client_sid)
 
 
 @socketio.on('send_text_message')
@@ -135,18 +242,19 @@ def handle_text_message(data):
     """ Receives text message from client's input box """
     client_sid = request.sid
     message = data.get('message', '')
-    print(f"Received text from {client_sid}: {message}")
-    if ada_instance and ada_instance.client_sid == client_sid:
-        if ada_loop and ada_loop.is_running():
-            # Process text with end_of_turn=True implicitly handled in process_input -> run_gemini_session
-            asyncio.run_coroutine_threadsafe(ada_instance.process_input(message, is_final_turn_input=True), ada_loop)
-            print(f"    Text message forwarded to ADA for SID: {client_sid}")
+    log.debug("Received text from %s: %s", client_sid, message)
+    ada = ada_instances.get(client_sid)
+    loop = ada_loop
+    if ada:
+        if loop and loop.is_running():
+            _post_to_ada('input', client_sid, message)
+            log.debug("Text message forwarded to ADA for SID: %s", client_sid)
         else:
-            print(f"    Cannot process text message for SID {client_sid}: asyncio loop not ready.")
+            log.warning("Cannot process text message for SID %s: asyncio loop not ready.", client_sid)
             emit('error', {'message': 'Assistant busy or loop error.'}, room=client_sid)
     else:
-        print(f"    ADA instance not ready or SID mismatch for text message from {client_sid}.")
-        emit('error', {'message': 'Assistant not ready or session mismatch.'}, room=client_sid)
+        log.warning("ADA instance not ready for text message from %s.", client_sid)
+        emit('error', {'message': 'Assistant not ready.'}, room=client_sid)
 
 
 @socketio.on('send_transcribed_text')
@@ -154,77 +262,97 @@ def handle_transcribed_text(data):
     """ Receives final transcribed text from client's Web Speech API """
     client_sid = request.sid
     transcript = data.get('transcript', '')
-    print(f"Received transcript from {client_sid}: {transcript}")
-    if transcript and ada_instance and ada_instance.client_sid == client_sid:
-         if ada_loop and ada_loop.is_running():
-            # Process transcript with end_of_turn=True implicitly handled in process_input -> run_gemini_session
-            asyncio.run_coroutine_threadsafe(ada_instance.process_input(transcript, is_final_turn_input=True), ada_loop)
-            print(f"    Transcript forwarded to ADA for SID: {client_sid}")
+    log.debug("Received transcript from %s: %s", client_sid, transcript)
+    ada = ada_instances.get(client_sid)
+    loop = ada_loop
+    if transcript and ada:
+         if loop and loop.is_running():
+            _post_to_ada('input', client_sid, transcript)
+            log.debug("Transcript forwarded to ADA for SID: %s", client_sid)
          else:
-             print(f"    Cannot process transcript for SID {client_sid}: asyncio loop not ready.")
+             log.warning("Cannot process transcript for SID %s: asyncio loop not ready.", client_sid)
              emit('error', {'message': 'Assistant busy or loop error.'}, room=client_sid)
     elif not transcript:
-         print("    Received empty transcript.")
+         log.debug("Received empty transcript.")
     else:
-         print(f"    ADA instance not ready or SID mismatch for transcript from {client_sid}.")
+         log.warning("ADA instance not ready for transcript from %s.", client_sid)
 
 
 # **** ADD VIDEO FRAME HANDLER ****
 @socketio.on('send_video_frame')
 def handle_video_frame(data):
-    """ Receives base64 video frame data from client """
+    """ Receives binary JPEG video frame data from client """
     client_sid = request.sid
-    frame_data_url = data.get('frame') # Expecting data URL like 'data:image/jpeg;base64,xxxxx'
+    frame_bytes = data # Client emits the raw JPEG ArrayBuffer, which arrives as bytes
+    if not isinstance(frame_bytes, (bytes, bytearray)):
+        # e.g. an older client still sending {'frame': dataURL}; storing it would break every Gemini turn
+        if client_sid not in _rejected_frame_sids:
+            _rejected_frame_sids.add(client_sid)
+            log.warning("Dropping non-binary video frames from %s (got %s).", client_sid, type(frame_bytes).__name__)
+        return
+    loop = ada_loop
 
-    if frame_data_url and ada_instance and ada_instance.client_sid == client_sid:
-        if ada_loop and ada_loop.is_running():
-            print(f"Received video frame from {client_sid}, forwarding...") # Optional: very verbose
-            asyncio.run_coroutine_threadsafe(ada_instance.process_video_frame(frame_data_url), ada_loop)
-        pass
+    global _frame_inflight
+    # Hot path (one call per frame per client): cheapest checks first, globals read once
+    if frame_bytes and client_sid in ada_instances and loop is not None and loop.is_running():
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Received video frame from %s, forwarding...", client_sid)
+        _pending_frames[client_sid] = (frame_bytes, "image/jpeg") # Replaces any frame ADA has not taken yet
+        if not _frame_inflight:
+            _frame_inflight = True
+            _post_to_ada('drain_frames', None)
 
 @socketio.on('video_feed_stopped')
 def handle_video_feed_stopped():
     """ Client signaled that the video feed has stopped. """
     client_sid = request.sid
-    print(f"Received video_feed_stopped signal from {client_sid}.")
-    if ada_instance and ada_instance.client_sid == client_sid:
-        if ada_loop and ada_loop.is_running():
-            # Call a method on ADA instance to clear its video queue
-            asyncio.run_coroutine_threadsafe(ada_instance.clear_video_queue(), ada_loop)
-            print(f"    Video frame queue clearing requested for SID: {client_sid}")
+    log.info("Received video_feed_stopped signal from %s.", client_sid)
+    ada = ada_instances.get(client_sid)
+    loop = ada_loop
+    if ada:
+        if loop and loop.is_running():
+            # ADA drops its stored frame so stale video is not attached to the next turn
+            _post_to_ada('video_stopped', client_sid)
+            log.debug("Video frame queue clearing requested for SID: %s", client_sid)
         else:
-            print(f"    Cannot clear video queue for SID {client_sid}: asyncio loop not ready.")
+            log.warning("Cannot clear video queue for SID %s: asyncio loop not ready.", client_sid)
     else:
-        print(f"    ADA instance not ready or SID mismatch for video_feed_stopped from {client_sid}.")
+        log.warning("ADA instance not ready for video_feed_stopped from %s.", client_sid)
 
 
 if __name__ == '__main__':
-    print("Starting Flask-SocketIO server...")
+    # Development server only; production runs through gunicorn (see wsgi.py)
+    init_ada()
+    log.info("Starting Flask-SocketIO server...")
     try:
-        socketio.run(app, debug=True, host='0.0.0.0', port=5000, use_reloader=False)
+        debug = os.getenv('FLASK_DEBUG', '0') == '1' # Werkzeug debug middleware only when explicitly requested
+        socketio.run(app, debug=debug, host='0.0.0.0', port=5000, use_reloader=False)
     finally:
-        print("\nServer shutting down...")
-        if ada_instance:
-             print("Attempting to stop active ADA instance on server shutdown...")
+        log.info("Server shutting down...")
+        if ada_instances:
+             log.info("Attempting to stop %s active ADA instance(s) on server shutdown...", len(ada_instances))
              if ada_loop and ada_loop.is_running():
-                 future = asyncio.run_coroutine_threadsafe(ada_instance.stop_all_tasks(), ada_loop)
-                 try:
-                     future.result(timeout=5)
-                     print("ADA tasks stopped.")
-                 except TimeoutError:
-                     print("Timeout stopping ADA tasks during shutdown.")
-                 except Exception as e:
-                     print(f"Exception stopping ADA tasks during shutdown: {e}")
+                 for client_sid, ada in list(ada_instances.items()):
+                     future = asyncio.run_coroutine_threadsafe(ada.stop_all_tasks(), ada_loop)
+                     try:
+                         future.result(timeout=5)
+                         log.info("ADA tasks stopped for SID %s.", client_sid)
+                     except TimeoutError:
+                         log.warning("Timeout stopping ADA tasks for SID %s during shutdown.", client_sid)
+                     except Exception as e:
+                         log.error("Exception stopping ADA tasks for SID %s during shutdown: %s", client_sid, e)
              else:
-                 print("Cannot stop ADA instance: asyncio loop not available.")
-             ada_instance = None
+                 log.warning("Cannot stop ADA instances: asyncio loop not available.")
+             ada_instances.clear()
 
         if ada_loop and ada_loop.is_running():
-             print("Stopping asyncio loop from main thread...")
-             ada_loop.call_soon_threadsafe(ada_loop.stop)
-             if ada_thread and ada_thread.is_alive():
-                 ada_thread.join(timeout=5)
-                 if ada_thread.is_alive():
-                     print("Warning: Asyncio thread did not exit cleanly.")
-             print("Asyncio loop/thread stop initiated.")
-        print("Shutdown complete.")
\ No newline at end of file
+             log.info("Stopping asyncio loop...")
+             ada_loop.call_soon_threadsafe(ada_stop_event.set)
+             for _ in range(50): # Give the loop task up to 5s to run its cleanup
+                 if ada_loop.is_closed():
+                     break
+                 socketio.sleep(0.1)
+             else:
+                 log.warning("Asyncio loop task did not exit cleanly.")
+             log.info("Asyncio loop stop initiated.")
+        log.info("Shutdown complete.")
@@ -0,0 +1,10 @@
+# fast_json.py (orjson-backed stand-in for the json module, used as the SocketIO serializer)
+import orjson
+
+def dumps(obj, **kwargs):
+    """ Serializes obj to a str; stdlib-only kwargs such as separators are ignored since orjson output is already compact """
+    return orjson.dumps(obj).decode('utf-8')
+
+def loads(s, **kwargs):
+    """ Parses a str or bytes JSON document """
+    return orjson.loads(s)
@@ -0,0 +1,15 @@
+# wsgi.py (Production entrypoint for gunicorn + eventlet)
+# Run with: gunicorn -k eventlet -w 1 --worker-connections 2000 wsgi:application
+# Requires gunicorn>=23,<26: gunicorn 26 removed the eventlet worker class (-k eventlet).
+# Keep -w 1: ada_instances and their shared asyncio loop are per-process state, so scale via --worker-connections.
+import os
+from dotenv import load_dotenv
+
+load_dotenv() # Load .env first so an explicit LOG_LEVEL there still wins
+os.environ.setdefault('LOG_LEVEL', 'WARNING') # Keep per-event debug/info logging off in production
+
+from app import app, init_ada
+
+init_ada() # Prewarm ADA before gunicorn starts routing connections to this worker
+
+application = app